@@ -126,7 +126,7 @@ Schema
         ).replace("{{schema}}", json.dumps(self.page_schema))
         response = self.llm_service(prompt, None, None, DocumentExtractionSchema)
 
-        logger.debug(f"Document extraction response: {response}")
+        logger.debug("Document extraction response: %s", response)
 
         if not response or any(
             [
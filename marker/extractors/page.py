@@ -117,7 +117,7 @@ Schema
             "{{page_md}}", page_markdown
         ).replace("{{schema}}", json.dumps(self.page_schema))
         response = self.llm_service(prompt, None, None, PageExtractionSchema)
-        logger.debug(f"Page extraction response: {response}")
+        logger.debug("Page extraction response: %s", response)
 
         if not response or any(
             [
@@ -1,9 +1,54 @@
 from typing import Annotated, List, Tuple
 
+import numpy as np
+
 from marker.processors import BaseProcessor
 from marker.schema import BlockTypes
-from marker.schema.blocks import ListItem
+from marker.schema.blocks import Block, ListItem
 from marker.schema.document import Document
+from marker.schema.groups import PageGroup
+
+
+def compute_indent_levels(
+    x_starts: np.ndarray,
+    x_ends: np.ndarray,
+    y_starts: np.ndarray,
+    is_list_item: np.ndarray,
+    indent_levels: np.ndarray,
+    x_indent: float,
+) -> np.ndarray:
+    """
+    Assign indent levels to the items of a list group with a monotonic stack over their x positions.
+    Only works with flat arrays, so the stack is a preallocated index array rather than a list of blocks.
+    """
+    count = x_starts.shape[0]
+    levels = indent_levels.astype(np.int32)
+    stack = np.zeros(count + 1, dtype=np.int32)
+    stack_size = 1 if count else 0
+
+    for i in range(count):
+        if not is_list_item[i]:
+            continue
+
+        x_start = x_starts[i]
+        while stack_size and x_start <= x_starts[stack[stack_size - 1]] + x_indent:
+            stack_size -= 1
+
+        if stack_size:
+            top = stack[stack_size - 1]
+            if y_starts[i] > y_starts[top]:
+                levels[i] = levels[top]
+                if x_start > x_starts[top] + x_indent:
+                    levels[i] += 1
+
+        if i + 1 < count and x_starts[i + 1] > x_ends[i]:
+            stack[0] = i + 1  # reset stack on column breaks
+            stack_size = 1
+        else:
+            stack[stack_size] = i
+            stack_size += 1
+
+    return levels
 
 
 class ListProcessor(BaseProcessor):
@@ -24,12 +69,21 @@ class ListProcessor(BaseProcessor):
         super().__init__(config)
 
     def __call__(self, document: Document):
-        self.list_group_continuation(document)
-        self.list_group_indentation(document)
-
-    def list_group_continuation(self, document: Document):
-        for page in document.pages:
-            for block in page.contained_blocks(document, self.block_types):
+        # Both passes walk the same list groups, so only traverse each page once
+        page_list_groups = [
+            (page, page.contained_blocks(document, self.block_types))
+            for page in document.pages
+        ]
+        self.list_group_continuation(document, page_list_groups)
+        self.list_group_indentation(document, page_list_groups)
+
+    def list_group_continuation(self, document: Document, page_list_groups: List[Tuple[PageGroup, List[Block]]]):
+        page_halves = {
+            page.page_id: (page.polygon.width // 2, page.polygon.height // 2)
+            for page in document.pages
+        }
+        for page, list_groups in page_list_groups:
+            for block in list_groups:
                 next_block = document.get_next_block(block, self.ignored_block_types)
                 if next_block is None:
                     continue
@@ -48,53 +102,56 @@ class ListProcessor(BaseProcessor):
                     column_break = next_block.polygon.y_start <= block.polygon.y_end
                 else:
                     page_break = True
-                    next_page = document.get_page(next_block.page_id)
-                    next_block_in_first_quadrant = (next_block.polygon.x_start < next_page.polygon.width // 2) and \
-                        (next_block.polygon.y_start < next_page.polygon.height // 2)
+                    half_width, half_height = page_halves[next_block.page_id]
+                    next_block_in_first_quadrant = (next_block.polygon.x_start < half_width) and \
+                        (next_block.polygon.y_start < half_height)
 
                 block.has_continuation = column_break or (page_break and next_block_in_first_quadrant)
 
-    def list_group_indentation(self, document: Document):
-        for page in document.pages:
-            for block in page.contained_blocks(document, self.block_types):
+    def list_group_indentation(self, document: Document, page_list_groups: List[Tuple[PageGroup, List[Block]]]):
+        for page, list_groups in page_list_groups:
+            x_indent = self.min_x_indent * page.polygon.width
+            for block in list_groups:
                 if block.structure is None:
                     continue
                 if block.ignore_for_output:
                     continue
 
-                stack: List[ListItem] = [block.get_next_block(page, None)]
-                for list_item_id in block.structure:
-                    list_item_block: ListItem = page.get_block(list_item_id)
-
-                    # This can be a line sometimes
-                    if list_item_block.block_type != BlockTypes.ListItem:
+                # Pull the geometry into flat arrays once, so the stack pass below only deals with indices
+                structure_blocks = [page.get_block(block_id) for block_id in block.structure]
+                count = len(structure_blocks)
+                x_starts = np.fromiter((b.polygon.x_start for b in structure_blocks), dtype=np.float64, count=count)
+                x_ends = np.fromiter((b.polygon.x_end for b in structure_blocks), dtype=np.float64, count=count)
+                y_starts = np.fromiter((b.polygon.y_start for b in structure_blocks), dtype=np.float64, count=count)
+                # This can be a line sometimes
+                is_list_item = np.fromiter((b.block_type == BlockTypes.ListItem for b in structure_blocks), dtype=bool, count=count)
+                indent_levels = np.fromiter((getattr(b, "list_indent_level", 0) for b in structure_blocks), dtype=np.int32, count=count)
+
+                indent_levels = compute_indent_levels(x_starts, x_ends, y_starts, is_list_item, indent_levels, x_indent)
+                for i in np.flatnonzero(is_list_item):
+                    structure_blocks[i].list_indent_level = int(indent_levels[i])
+
+                # Compare plain ints from the computed levels, instead of reading them back off each block
+                levels = indent_levels.tolist()
+                list_item_flags = is_list_item.tolist()
+                stack: List[int] = []
+                nested_ids = set()
+                for i, list_item_block in enumerate(structure_blocks):
+                    # Lines have no indent level, so they can't be nested or be a parent
+                    if not list_item_flags[i]:
                         continue
 
-                    while stack and list_item_block.polygon.x_start <= stack[-1].polygon.x_start + (self.min_x_indent * page.polygon.width):
-                        stack.pop()
-
-                    if stack and list_item_block.polygon.y_start > stack[-1].polygon.y_start:
-                        list_item_block.list_indent_level = stack[-1].list_indent_level
-                        if list_item_block.polygon.x_start > stack[-1].polygon.x_start + (self.min_x_indent * page.polygon.width):
-                            list_item_block.list_indent_level += 1
-
-                    next_list_item_block = block.get_next_block(page, list_item_block)
-                    if next_list_item_block is not None and next_list_item_block.polygon.x_start > list_item_block.polygon.x_end:
-                        stack = [next_list_item_block]  # reset stack on column breaks
-                    else:
-                        stack.append(list_item_block)
-
-                stack: List[ListItem] = [block.get_next_block(page, None)]
-                for list_item_id in block.structure.copy():
-                    list_item_block: ListItem = page.get_block(list_item_id)
-
-                    while stack and list_item_block.list_indent_level <= stack[-1].list_indent_level:
+                    level = levels[i]
+                    while stack and level <= levels[stack[-1]]:
                         stack.pop()
 
                     if stack:
-                        current_parent = stack[-1]
+                        current_parent: ListItem = structure_blocks[stack[-1]]
                         current_parent.add_structure(list_item_block)
                         current_parent.polygon = current_parent.polygon.merge([list_item_block.polygon])
 
-                        block.remove_structure_items([list_item_id])
-                    stack.append(list_item_block)
+                        nested_ids.add(list_item_block.id)
+                    stack.append(i)
+
+                # Nested items now live under their parent item, so drop them from the group in one pass
+                block.remove_structure_items(nested_ids)
@@ -1,5 +1,4 @@
 import json
-import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Annotated, TypedDict, List, Sequence
 
@@ -87,17 +86,19 @@ class BaseLLMProcessor(BaseProcessor):
         page_height = page.polygon.height
         block_bbox = block.polygon.bbox
 
-        # Normalize bbox to 0-1000 range
+        # Normalize bbox to 0-1000 range, rounded so each coordinate costs fewer prompt tokens
         normalized_bbox = [
-            (block_bbox[0] / page_width) * 1000,
-            (block_bbox[1] / page_height) * 1000,
-            (block_bbox[2] / page_width) * 1000,
-            (block_bbox[3] / page_height) * 1000,
+            round((block_bbox[0] / page_width) * 1000),
+            round((block_bbox[1] / page_height) * 1000),
+            round((block_bbox[2] / page_width) * 1000),
+            round((block_bbox[3] / page_height) * 1000),
         ]
 
+        # Block.id builds a new BlockId on every access
+        block_id = block.id
         block_json = {
-            "id": str(block.id),
-            "block_type": str(block.id.block_type),
+            "id": str(block_id),
+            "block_type": str(block_id.block_type),
             "bbox": normalized_bbox,
             "html": json_to_html(block.render(document)),
         }
@@ -110,13 +111,7 @@ class BaseLLMProcessor(BaseProcessor):
     def handle_rewrites(self, blocks: list, document: Document):
         for block_data in blocks:
             try:
-                block_id = block_data["id"].strip().lstrip("/")
-                _, page_id, block_type, block_id = block_id.split("/")
-                block_id = BlockId(
-                    page_id=page_id,
-                    block_id=block_id,
-                    block_type=getattr(BlockTypes, block_type),
-                )
+                block_id = BlockId.from_str(block_data["id"])
                 block = document.get_block(block_id)
                 if not block:
                     logger.debug(f"Block {block_id} not found in document")
@@ -147,12 +142,15 @@ class BaseLLMComplexBlockProcessor(BaseLLMProcessor):
         raise NotImplementedError()
 
     def rewrite_blocks(self, document: Document):
-        # Don't show progress if there are no blocks to process
-        total_blocks = sum(
-            len(page.contained_blocks(document, self.block_types))
+        # Collect the blocks once, and reuse them for both the empty check and the submissions
+        page_blocks = [
+            (page, block)
             for page in document.pages
-        )
-        if total_blocks == 0:
+            for block in page.contained_blocks(document, self.block_types)
+        ]
+
+        # Don't show progress if there are no blocks to process
+        if len(page_blocks) == 0:
             return
 
         pbar = tqdm(
@@ -162,8 +160,7 @@ class BaseLLMComplexBlockProcessor(BaseLLMProcessor):
             for future in as_completed(
                 [
                     executor.submit(self.process_rewriting, document, page, block)
-                    for page in document.pages
-                    for block in page.contained_blocks(document, self.block_types)
+                    for page, block in page_blocks
                 ]
             ):
                 future.result()  # Raise exceptions if any occurred
@@ -186,7 +183,7 @@ class BaseLLMSimpleBlockProcessor(BaseLLMProcessor):
             self.rewrite_block(result, prompt_data, document)
         except Exception as e:
             logger.warning(f"Error rewriting block in {self.__class__.__name__}: {e}")
-            traceback.print_exc()
+            logger.debug("Traceback for block rewrite error", exc_info=True)
 
     def inference_blocks(self, document: Document) -> List[BlockData]:
         blocks = []
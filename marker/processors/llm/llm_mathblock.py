@@ -1,5 +1,5 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Tuple, Annotated
+from typing import Tuple, Annotated
 
 from pydantic import BaseModel
 from tqdm import tqdm
@@ -8,7 +8,7 @@ from marker.output import json_to_html, unwrap_outer_tag
 from marker.processors.llm import BaseLLMComplexBlockProcessor
 
 from marker.schema import BlockTypes
-from marker.schema.blocks import Block, InlineMath
+from marker.schema.blocks import Block
 from marker.schema.document import Document
 from marker.schema.groups import PageGroup
 
@@ -77,45 +77,38 @@ Adversarial training <i>(AT)</i> <a href='#page-9-1'>[23]</a>, which aims to min
         if not self.redo_inline_math:
             return
 
-        # Get inline math blocks
-        inline_blocks: List[InlineMath] = [
-            (page, block)
-            for page in document.pages
-            for block in page.contained_blocks(document, self.block_types)
-        ]
-
-        # Get other blocks with detected math in them
-        detected_blocks = [
-            (page, block)
-            for page in document.pages
-            for block in page.contained_blocks(
-                document,
-                (
-                    BlockTypes.Text,
-                    BlockTypes.Caption,
-                    BlockTypes.SectionHeader,
-                    BlockTypes.Footnote,
-                    BlockTypes.ListItem,
-                ),
-            )
-            if any(
-                [
-                    b.formats and "math" in b.formats
-                    for b in block.contained_blocks(document, (BlockTypes.Line,))
-                ]
-            )
-        ]
-
-        # If a page has enough math blocks, assume all blocks can contain math
+        inline_blocks = []
+        detected_blocks = []
         additional_text_blocks = []
         for page in document.pages:
-            # Check for inline math blocks
-            page_inlinemath_blocks = [
-                im for im in inline_blocks if im[0].page_id == page.page_id
-            ]
+            # Get inline math blocks
+            page_inlinemath_blocks = page.contained_blocks(document, self.block_types)
+
+            # Get other blocks with detected math in them
             page_detected_blocks = [
-                db for db in detected_blocks if db[0].page_id == page.page_id
+                block
+                for block in page.contained_blocks(
+                    document,
+                    (
+                        BlockTypes.Text,
+                        BlockTypes.Caption,
+                        BlockTypes.SectionHeader,
+                        BlockTypes.Footnote,
+                        BlockTypes.ListItem,
+                    ),
+                )
+                if any(
+                    [
+                        b.formats and "math" in b.formats
+                        for b in block.contained_blocks(document, (BlockTypes.Line,))
+                    ]
+                )
             ]
+
+            inline_blocks.extend((page, block) for block in page_inlinemath_blocks)
+            detected_blocks.extend((page, block) for block in page_detected_blocks)
+
+            # If a page has enough math blocks, assume all blocks can contain math
             math_block_count = len(page_inlinemath_blocks) + len(page_detected_blocks)
 
             # Find all potential blocks
@@ -130,8 +123,12 @@ Adversarial training <i>(AT)</i> <a href='#page-9-1'>[23]</a>, which aims to min
             ):
                 continue
 
+            # Blocks that were already selected above shouldn't be rewritten twice
+            selected_ids = {
+                block.id for block in page_inlinemath_blocks + page_detected_blocks
+            }
             for b in additional_blocks:
-                if b not in detected_blocks and b not in inline_blocks:
+                if b.id not in selected_ids:
                     additional_text_blocks.append((page, b))
 
         inference_blocks = inline_blocks + detected_blocks + additional_text_blocks
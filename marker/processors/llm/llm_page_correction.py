@@ -4,7 +4,6 @@ from typing import List, Annotated
 
 from marker.logger import get_logger
 from marker.processors.llm import BaseLLMComplexBlockProcessor
-from marker.schema import BlockTypes
 from marker.schema.blocks import BlockId
 from marker.schema.document import Document
 from marker.schema.groups import PageGroup
@@ -149,6 +148,10 @@ User Prompt
 
     def process_rewriting(self, document: Document, page1: PageGroup):
         page_blocks = self.get_selected_blocks(document, page1)
+        if not page_blocks:
+            # Nothing to reorder or rewrite on an empty page
+            return
+
         image = page1.get_image(document, highres=False)
 
         prompt = (
@@ -157,7 +160,7 @@ User Prompt
             .replace("{{user_prompt}}", self.block_correction_prompt)
         )
         response = self.llm_service(prompt, image, page1, PageSchema)
-        logger.debug(f"Got reponse from LLM: {response}")
+        logger.debug("Got reponse from LLM: %s", response)
 
         if not response or "correction_type" not in response:
             logger.warning("LLM did not return a valid response")
@@ -185,85 +188,38 @@ User Prompt
             response["blocks"] = json.loads(response["blocks"])
 
     def handle_reorder(self, blocks: list, page1: PageGroup):
-        unique_page_ids = set()
-        document_page_ids = [str(page1.page_id)]
-        document_pages = [page1]
-
+        block_ids_for_page = []
         for block_data in blocks:
             try:
-                page_id, _, _ = block_data["id"].split("/")
-                unique_page_ids.add(page_id)
+                block_ids_for_page.append(BlockId.from_str(block_data["id"]))
             except Exception as e:
                 logger.debug(f"Error parsing block ID {block_data['id']}: {e}")
                 continue
 
-        if set(document_page_ids) != unique_page_ids:
+        if any(block_id.page_id != page1.page_id for block_id in block_ids_for_page):
             logger.debug(
                 "Some page IDs in the response do not match the document's pages"
             )
             return
 
-        for page_id, document_page in zip(unique_page_ids, document_pages):
-            block_ids_for_page = []
-            for block_data in blocks:
-                try:
-                    page_id, block_type, block_id = block_data["id"].split("/")
-                    block_id = BlockId(
-                        page_id=page_id,
-                        block_id=block_id,
-                        block_type=getattr(BlockTypes, block_type),
-                    )
-                    block_ids_for_page.append(block_id)
-                except Exception as e:
-                    logger.debug(f"Error parsing block ID {block_data['id']}: {e}")
-                    continue
-
-                # Both sides should have the same values, just be reordered
-                if not all(
-                    [
-                        block_id in document_page.structure
-                        for block_id in block_ids_for_page
-                    ]
-                ):
-                    logger.debug(
-                        f"Some blocks for page {page_id} not found in document"
-                    )
-                    continue
-
-                if not all(
-                    [
-                        block_id in block_ids_for_page
-                        for block_id in document_page.structure
-                    ]
-                ):
-                    logger.debug(
-                        f"Some blocks in document page {page_id} not found in response"
-                    )
-                    continue
-
-                # Swap the order of blocks in the document page
-                document_page.structure = block_ids_for_page
-
-    def handle_rewrites(self, blocks: list, document: Document):
-        for block_data in blocks:
-            try:
-                block_id = block_data["id"].strip().lstrip("/")
-                _, page_id, block_type, block_id = block_id.split("/")
-                block_id = BlockId(
-                    page_id=page_id,
-                    block_id=block_id,
-                    block_type=getattr(BlockTypes, block_type),
-                )
-                block = document.get_block(block_id)
-                if not block:
-                    logger.debug(f"Block {block_id} not found in document")
-                    continue
-
-                if hasattr(block, "html"):
-                    block.html = block_data["html"]
-            except Exception as e:
-                logger.debug(f"Error parsing block ID {block_data['id']}: {e}")
-                continue
+        # Both sides should have the same values, just be reordered
+        response_block_ids = set(block_ids_for_page)
+        document_block_ids = set(page1.structure)
+        if (
+            len(block_ids_for_page) != len(page1.structure)
+            or not response_block_ids <= document_block_ids
+        ):
+            logger.debug(f"Some blocks for page {page1.page_id} not found in document")
+            return
+
+        if not document_block_ids <= response_block_ids:
+            logger.debug(
+                f"Some blocks in document page {page1.page_id} not found in response"
+            )
+            return
+
+        # Swap the order of blocks in the document page
+        page1.structure = block_ids_for_page
 
     def rewrite_blocks(self, document: Document):
         if not self.block_correction_prompt:
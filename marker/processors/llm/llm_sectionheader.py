@@ -1,20 +1,26 @@
 import json
-from typing import List, Tuple
+from typing import Annotated, List, Tuple
 
 from tqdm import tqdm
 
 from marker.logger import get_logger
 from marker.processors.llm import BaseLLMComplexBlockProcessor
 from marker.schema import BlockTypes
-from marker.schema.blocks import Block
+from marker.schema.blocks import Block, BlockId
 from marker.schema.document import Document
-from marker.schema.groups import PageGroup
+from marker.services import BaseService
 from pydantic import BaseModel
 
 logger = get_logger()
 
 
 class LLMSectionHeaderProcessor(BaseLLMComplexBlockProcessor):
+    max_headers_per_request: Annotated[
+        int,
+        "The maximum number of section headers to send to the LLM in a single request, to keep long documents within the context window.",
+        "Default is None, which will send all of the headers at once.",
+    ] = None
+
     page_prompt = """You're a text correction expert specializing in accurately analyzing complex PDF documents. You will be given a list of all of the section headers from a document, along with their page number and approximate dimensions.  The headers will be formatted like below, and will be presented in order.
 
 ```json
@@ -94,22 +100,28 @@ Section Headers
 ```json
 {{section_header_json}}
 ```
+"""
+    batch_prompt = """
+Note: This document has too many section headers to send at once, so the list above is a contiguous slice of the document's section headers, in order.  There may be headers before and after this slice, so the first header here is not necessarily a top-level header.  If the first header has "context": true, it is the last header of the previous slice and was already corrected.  Use it to decide the levels of the headers that follow, but do not output it.
 """
 
-    def get_selected_blocks(
-        self,
-        document: Document,
-        page: PageGroup,
-    ) -> List[dict]:
-        selected_blocks = page.structure_blocks(document)
-        json_blocks = [
-            self.normalize_block_json(block, document, page, i)
-            for i, block in enumerate(selected_blocks)
-        ]
-        return json_blocks
+    def __init__(self, llm_service: BaseService, config=None):
+        super().__init__(llm_service, config)
+
+        if (
+            self.max_headers_per_request is not None
+            and self.max_headers_per_request < 1
+        ):
+            raise ValueError(
+                f"max_headers_per_request must be at least 1, got {self.max_headers_per_request}"
+            )
 
     def process_rewriting(
-        self, document: Document, section_headers: List[Tuple[Block, dict]]
+        self,
+        document: Document,
+        section_headers: List[Tuple[Block, dict]],
+        context_block_id: BlockId | None = None,
+        batched: bool = False,
     ):
         section_header_json = [sh[1] for sh in section_headers]
         for item in section_header_json:
@@ -118,14 +130,18 @@ Section Headers
             item["width"] = item["bbox"][2] - item["bbox"][0]
             item["height"] = item["bbox"][3] - item["bbox"][1]
             del item["block_type"]  # Not needed, since they're all section headers
+            if self.matches_block_id(item, context_block_id):
+                item["context"] = True
 
         prompt = self.page_prompt.replace(
             "{{section_header_json}}", json.dumps(section_header_json)
         )
+        if batched:
+            prompt += self.batch_prompt
         response = self.llm_service(
             prompt, None, document.pages[0], SectionHeaderSchema
         )
-        logger.debug(f"Got section header reponse from LLM: {response}")
+        logger.debug("Got section header reponse from LLM: %s", response)
 
         if not response or "correction_type" not in response:
             logger.warning("LLM did not return a valid response")
@@ -136,7 +152,24 @@ Section Headers
             return
 
         self.load_blocks(response)
-        self.handle_rewrites(response["blocks"], document)
+        blocks = response["blocks"]
+        if context_block_id is not None:
+            # The context header was already corrected by the previous batch
+            blocks = [
+                block_data
+                for block_data in blocks
+                if not self.matches_block_id(block_data, context_block_id)
+            ]
+        self.handle_rewrites(blocks, document)
+
+    @staticmethod
+    def matches_block_id(block_data: dict, block_id: BlockId | None) -> bool:
+        if block_id is None:
+            return False
+        try:
+            return BlockId.from_str(block_data["id"]) == block_id
+        except Exception:
+            return False
 
     def load_blocks(self, response):
         if isinstance(response["blocks"], str):
@@ -145,7 +178,7 @@ Section Headers
     def rewrite_blocks(self, document: Document):
         # Don't show progress if there are no blocks to process
         section_headers = [
-            (block, self.normalize_block_json(block, document, page))
+            (page, block)
             for page in document.pages
             for block in page.structure_blocks(document)
             if block.block_type == BlockTypes.SectionHeader
@@ -153,14 +186,33 @@ Section Headers
         if len(section_headers) == 0:
             return
 
+        batch_size = self.max_headers_per_request or len(section_headers)
+        batch_starts = range(0, len(section_headers), batch_size)
+
         pbar = tqdm(
-            total=1,
+            total=len(batch_starts),
             desc=f"Running {self.__class__.__name__}",
             disable=self.disable_tqdm,
         )
 
-        self.process_rewriting(document, section_headers)
-        pbar.update(1)
+        for start in batch_starts:
+            batch = section_headers[start : start + batch_size]
+            context_block_id = None
+            if start > 0:
+                # Repeat the previous batch's last header, so each batch knows the current heading level
+                context_page, context_block = section_headers[start - 1]
+                batch = [(context_page, context_block)] + batch
+                context_block_id = context_block.id
+
+            # Normalize when the batch starts, so headers corrected by earlier batches are sent as corrected
+            batch_json = [
+                (block, self.normalize_block_json(block, document, page))
+                for page, block in batch
+            ]
+            self.process_rewriting(
+                document, batch_json, context_block_id, len(batch_starts) > 1
+            )
+            pbar.update(1)
         pbar.close()
 
 
@@ -132,16 +132,16 @@ No corrections needed.
         parsed_cells = []
         row_shift = 0
         block_image = self.extract_image(document, block)
+        # Fetch the page image size once, since get_image may convert the whole page on each call
+        highres_size = page.get_image(highres=True).size
         block_rescaled_bbox = block.polygon.rescale(
-            page.polygon.size, page.get_image(highres=True).size
+            page.polygon.size, highres_size
         ).bbox
         for i in range(0, row_count, self.max_rows_per_batch):
-            batch_row_idxs = row_idxs[i : i + self.max_rows_per_batch]
+            batch_row_idxs = set(row_idxs[i : i + self.max_rows_per_batch])
             batch_cells = [cell for cell in children if cell.row_id in batch_row_idxs]
             batch_cell_bboxes = [
-                cell.polygon.rescale(
-                    page.polygon.size, page.get_image(highres=True).size
-                ).bbox
+                cell.polygon.rescale(page.polygon.size, highres_size).bbox
                 for cell in batch_cells
             ]
             # bbox relative to the block
@@ -1,5 +1,6 @@
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Annotated, List, Tuple, Literal
+from typing import Annotated, Dict, List, Tuple, Literal
 
 from pydantic import BaseModel
 from tqdm import tqdm
@@ -8,8 +9,9 @@ from PIL import Image
 from marker.output import json_to_html
 from marker.processors.llm import BaseLLMComplexBlockProcessor
 from marker.schema import BlockTypes
-from marker.schema.blocks import Block, TableCell
+from marker.schema.blocks import Block, BlockId, TableCell
 from marker.schema.document import Document
+from marker.services import BaseService
 from marker.logger import get_logger
 
 logger = get_logger()
@@ -123,35 +125,33 @@ Table 2
 ```
 """
 
+    def __init__(self, llm_service: BaseService, config=None):
+        super().__init__(llm_service, config)
+
+        # Split the prompt around the table placeholders once, so building each pair's prompt is a single join
+        prefix, _, remainder = self.table_merge_prompt.partition("{{table1}}")
+        middle, _, suffix = remainder.partition("{{table2}}")
+        self.table_merge_prompt_parts = (prefix, middle, suffix)
+
     @staticmethod
     def get_row_count(cells: List[TableCell]):
         if not cells:
             return 0
 
-        max_rows = None
-        for col_id in set([cell.col_id for cell in cells]):
-            col_cells = [cell for cell in cells if cell.col_id == col_id]
-            rows = 0
-            for cell in col_cells:
-                rows += cell.rowspan
-            if max_rows is None or rows > max_rows:
-                max_rows = rows
-        return max_rows
+        col_rows = defaultdict(int)
+        for cell in cells:
+            col_rows[cell.col_id] += cell.rowspan
+        return max(col_rows.values())
 
     @staticmethod
     def get_column_count(cells: List[TableCell]):
         if not cells:
             return 0
 
-        max_cols = None
-        for row_id in set([cell.row_id for cell in cells]):
-            row_cells = [cell for cell in cells if cell.row_id == row_id]
-            cols = 0
-            for cell in row_cells:
-                cols += cell.colspan
-            if max_cols is None or cols > max_cols:
-                max_cols = cols
-        return max_cols
+        row_cols = defaultdict(int)
+        for cell in cells:
+            row_cols[cell.row_id] += cell.colspan
+        return max(row_cols.values())
 
     def rewrite_blocks(self, document: Document):
         # Skip table merging if disabled via config
@@ -164,20 +164,26 @@ Table 2
         table_run = []
         prev_block = None
         prev_page_block_count = None
+        prev_counts = None
+        table_cells: Dict[BlockId, List[TableCell]] = {}
         for page in document.pages:
             page_blocks = page.contained_blocks(document, self.block_types)
             for block in page_blocks:
+                # Each table is compared as the current block, then again as the previous block
+                curr_cells = block.contained_blocks(document, (BlockTypes.TableCell,))
+                table_cells[block.id] = curr_cells
+                curr_counts = (self.get_row_count(curr_cells), self.get_column_count(curr_cells))
+
                 merge_condition = False
                 if prev_block is not None:
-                    prev_cells = prev_block.contained_blocks(document, (BlockTypes.TableCell,))
-                    curr_cells = block.contained_blocks(document, (BlockTypes.TableCell,))
-                    row_match = abs(self.get_row_count(prev_cells) - self.get_row_count(curr_cells)) < 5, # Similar number of rows
-                    col_match = abs(self.get_column_count(prev_cells) - self.get_column_count(curr_cells)) < 2
+                    row_match = abs(prev_counts[0] - curr_counts[0]) < 5 # Similar number of rows
+                    col_match = abs(prev_counts[1] - curr_counts[1]) < 2
 
                     subsequent_page_table = all([
                         prev_block.page_id == block.page_id - 1, # Subsequent pages
                         max(prev_block.polygon.height / page.polygon.height,
                             block.polygon.height / page.polygon.height) > self.table_height_threshold, # Take up most of the page height
+                            block.polygon.y_start / page.polygon.height < self.table_start_threshold, # Second table starts near the top of its page
                             (len(page_blocks) == 1 or prev_page_block_count == 1), # Only table on the page
                             (row_match or col_match)
                         ])
@@ -216,6 +222,7 @@ Table 2
                         table_runs.append(table_run)
                     table_run = []
                 prev_block = block
+                prev_counts = curr_counts
             prev_page_block_count = len(page_blocks)
 
         if table_run:
@@ -223,7 +230,7 @@ Table 2
 
         with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
             for future in as_completed([
-                executor.submit(self.process_rewriting, document, blocks)
+                executor.submit(self.process_rewriting, document, blocks, table_cells)
                 for blocks in table_runs
             ]):
                 future.result()  # Raise exceptions if any occurred
@@ -231,26 +238,32 @@ Table 2
 
         pbar.close()
 
-    def process_rewriting(self, document: Document, blocks: List[Block]):
+    def process_rewriting(self, document: Document, blocks: List[Block], table_cells: Dict[BlockId, List[TableCell]]):
         if len(blocks) < 2:
             # Can't merge single tables
             return
 
         start_block = blocks[0]
+        children = table_cells[start_block.id]
+        start_image = None
+        start_html = None
         for i in range(1, len(blocks)):
             curr_block = blocks[i]
-            children = start_block.contained_blocks(document, (BlockTypes.TableCell,))
-            children_curr = curr_block.contained_blocks(document, (BlockTypes.TableCell,))
+            children_curr = table_cells[curr_block.id]
             if not children or not children_curr:
                 # Happens if table/form processors didn't run
                 break
 
-            start_image = start_block.get_image(document, highres=False)
+            # Each table's image and html are built once, then carried forward when it becomes the start table
+            if start_image is None:
+                start_image = start_block.get_image(document, highres=False)
             curr_image = curr_block.get_image(document, highres=False)
-            start_html = json_to_html(start_block.render(document))
+            if start_html is None:
+                start_html = json_to_html(start_block.render(document))
             curr_html = json_to_html(curr_block.render(document))
 
-            prompt = self.table_merge_prompt.replace("{{table1}}", start_html).replace("{{table2}}", curr_html)
+            prefix, middle, suffix = self.table_merge_prompt_parts
+            prompt = "".join((prefix, start_html, middle, curr_html, suffix))
 
             response = self.llm_service(
                 prompt,
@@ -268,12 +281,18 @@ Table 2
             # The original table is okay
             if "true" not in merge:
                 start_block = curr_block
+                children = children_curr
+                start_image = curr_image
+                start_html = curr_html
                 continue
 
             # Merge the cells and images of the tables
             direction = response["direction"]
             if not self.validate_merge(children, children_curr, direction):
                 start_block = curr_block
+                children = children_curr
+                start_image = curr_image
+                start_html = curr_html
                 continue
 
             merged_image = self.join_images(start_image, curr_image, direction)
@@ -281,6 +300,9 @@ Table 2
             curr_block.structure = []
             start_block.structure = [b.id for b in merged_cells]
             start_block.lowres_image = merged_image
+            children = merged_cells
+            start_image = merged_image
+            start_html = None  # The merged table needs to be rendered again
 
     def validate_merge(self, cells1: List[TableCell], cells2: List[TableCell], direction: Literal['right', 'bottom'] = 'right'):
         if direction == "right":
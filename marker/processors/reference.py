@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 import numpy as np
 
 from marker.processors import BaseProcessor
@@ -40,8 +42,9 @@ class ReferenceProcessor(BaseProcessor):
                 continue
 
             distances = np.linalg.norm(block_starts[:, np.newaxis, :] - ref_starts[np.newaxis, :, :], axis=2)
+            block_ref_ids = defaultdict(list)
             for ref_idx in range(len(ref_starts)):
-                block_idx = np.argmin(distances[:, ref_idx])
+                block_idx = int(np.argmin(distances[:, ref_idx]))
                 block = blocks[block_idx]
 
                 ref_block = page.add_full_block(ReferenceClass(
@@ -49,6 +52,11 @@ class ReferenceProcessor(BaseProcessor):
                     polygon=block.polygon,
                     page_id=page.page_id
                 ))
+                block_ref_ids[block_idx].append(ref_block.id)
+
+            # Prepend all references to a block at once, latest reference first
+            for block_idx, ref_ids in block_ref_ids.items():
+                block = blocks[block_idx]
                 if block.structure is None:
                     block.structure = []
-                block.structure.insert(0, ref_block.id)
+                block.structure[:0] = ref_ids[::-1]
@@ -17,11 +17,14 @@ from marker.schema.blocks.tablecell import TableCell
 from marker.schema.document import Document
 from marker.schema.polygon import PolygonBox
 from marker.settings import settings
-from marker.util import matrix_intersection_area
+from marker.util import SPACE_TRANSLATION, matrix_intersection_area
 from marker.logger import get_logger
 
 logger = get_logger()
 
+SPACED_DOTS_PATTERN = re.compile(r"(\s\.){2,}")
+DOTS_PATTERN = re.compile(r"\.{2,}")
+
 
 class TableProcessor(BaseProcessor):
     """
@@ -185,40 +188,39 @@ class TableProcessor(BaseProcessor):
             text = line["text"].strip()
             if not text or text == ".":
                 continue
-            text = re.sub(r"(\s\.){2,}", "", text)  # Replace . . .
-            text = re.sub(r"\.{2,}", "", text)  # Replace ..., like in table of contents
+            text = SPACED_DOTS_PATTERN.sub("", text)  # Replace . . .
+            text = DOTS_PATTERN.sub("", text)  # Replace ..., like in table of contents
             text = self.normalize_spaces(fix_text(text))
             fixed_text.append(text)
         return fixed_text
 
     @staticmethod
     def normalize_spaces(text):
-        space_chars = [
-            "\u2003",  # em space
-            "\u2002",  # en space
-            "\u00a0",  # non-breaking space
-            "\u200b",  # zero-width space
-            "\u3000",  # ideographic space
-        ]
-        for space in space_chars:
-            text = text.replace(space, " ")
-        return text
+        # Single pass over the text, instead of one replace per space character
+        return text.translate(SPACE_TRANSLATION)
 
     def combine_dollar_column(self, tables: List[TableResult]):
         for table in tables:
             if len(table.cells) == 0:
                 # Skip empty tables
                 continue
-            unique_cols = sorted(list(set([c.col_id for c in table.cells])))
+            cells_by_col = defaultdict(list)
+            for c in table.cells:
+                cells_by_col[c.col_id].append(c)
+            unique_cols = sorted(cells_by_col)
             max_col = max(unique_cols)
             dollar_cols = []
             for col in unique_cols:
                 # Cells in this col
-                col_cells = [c for c in table.cells if c.col_id == col]
-                col_text = [
-                    "\n".join(self.finalize_cell_text(c)).strip() for c in col_cells
-                ]
-                all_dollars = all([ct in ["", "$"] for ct in col_text])
+                col_cells = cells_by_col[col]
+                # Stop finalizing cell text at the first cell that isn't a dollar sign
+                all_dollars = all(
+                    "\n".join(self.finalize_cell_text(c)).strip() in ["", "$"]
+                    for c in col_cells
+                )
+                if not all_dollars:
+                    continue
+
                 colspans = [c.colspan for c in col_cells]
                 span_into_col = [
                     c
@@ -229,14 +231,13 @@ class TableProcessor(BaseProcessor):
                 # This is a column that is entirely dollar signs
                 if all(
                     [
-                        all_dollars,
                         len(col_cells) > 1,
                         len(span_into_col) == 0,
                         all([c == 1 for c in colspans]),
                         col < max_col,
                     ]
                 ):
-                    next_col_cells = [c for c in table.cells if c.col_id == col + 1]
+                    next_col_cells = cells_by_col.get(col + 1, [])
                     next_col_rows = [c.row_id for c in next_col_cells]
                     col_rows = [c.row_id for c in col_cells]
                     if (
@@ -257,27 +258,31 @@ class TableProcessor(BaseProcessor):
 
                 if col in dollar_cols:
                     col_offset += 1
+                    # Index the next column by row once, instead of scanning all cells for every dollar cell
+                    next_col_cells = {}
+                    for c in table.cells:
+                        if c.col_id == col + 1:
+                            next_col_cells.setdefault(c.row_id, c)
+
+                    removed_cell_ids = set()
                     for cell in col_cells:
                         text_lines = cell.text_lines if cell.text_lines else []
-                        next_row_col = [
-                            c
-                            for c in table.cells
-                            if c.row_id == cell.row_id and c.col_id == col + 1
-                        ]
+                        next_cell = next_col_cells[cell.row_id]
 
                         # Add dollar to start of the next column
                         next_text_lines = (
-                            next_row_col[0].text_lines
-                            if next_row_col[0].text_lines
-                            else []
+                            next_cell.text_lines if next_cell.text_lines else []
                         )
-                        next_row_col[0].text_lines = deepcopy(text_lines) + deepcopy(
+                        next_cell.text_lines = deepcopy(text_lines) + deepcopy(
                             next_text_lines
                         )
-                        table.cells = [
-                            c for c in table.cells if c.cell_id != cell.cell_id
-                        ]  # Remove original cell
-                        next_row_col[0].col_id -= col_offset
+                        removed_cell_ids.add(cell.cell_id)
+                        next_cell.col_id -= col_offset
+
+                    # Remove original cells
+                    table.cells = [
+                        c for c in table.cells if c.cell_id not in removed_cell_ids
+                    ]
                 else:
                     for cell in col_cells:
                         cell.col_id -= col_offset
@@ -1,7 +1,6 @@
 import base64
 import os
 import tempfile
-import traceback
 
 from marker.logger import get_logger
 from marker.providers.pdf import PdfProvider
@@ -51,7 +50,7 @@ class PowerPointProvider(PdfProvider):
         try:
             self.convert_pptx_to_pdf(filepath)
         except Exception as e:
-            print(traceback.format_exc())
+            logger.debug("Traceback for PPTX conversion error", exc_info=True)
             raise ValueError(f"Error converting PPTX to PDF: {e}")
 
         # Initalize the PDF provider with the temp pdf path
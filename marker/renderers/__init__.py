@@ -126,15 +126,20 @@ class BaseRenderer:
         content_refs = soup.find_all("content-ref")
         ref_block_id = None
         images = {}
+
+        # Look up children by id once, instead of scanning them for every content ref
+        children_by_id = {}
+        for item in block_output.children:
+            children_by_id.setdefault(str(item.id), item)
+
         for ref in content_refs:
             src = ref.get("src")
             sub_images = {}
-            for item in block_output.children:
-                if item.id == src:
-                    content, sub_images_ = self.extract_block_html(document, item)
-                    sub_images.update(sub_images_)
-                    ref_block_id: BlockId = item.id
-                    break
+            item = children_by_id.get(src)
+            if item is not None:
+                content, sub_images_ = self.extract_block_html(document, item)
+                sub_images.update(sub_images_)
+                ref_block_id: BlockId = item.id
 
             if ref_block_id.block_type in self.image_blocks and self.extract_images:
                 images[ref_block_id] = self.extract_image(
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Sequence, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from pydantic import BaseModel, ConfigDict, field_validator
 from PIL import Image
@@ -79,6 +88,16 @@ class BlockId(BaseModel):
     def to_path(self):
         return str(self).replace("/", "_")
 
+    @classmethod
+    def from_str(cls, id_str: str) -> BlockId:
+        # Parses the /page/0/Text/1 format produced by __str__, as returned by the LLM processors
+        _, page_id, block_type, block_id = id_str.strip().lstrip("/").split("/")
+        return cls(
+            page_id=int(page_id),
+            block_id=int(block_id),
+            block_type=BlockTypes[block_type],
+        )
+
 
 class Block(BaseModel):
     polygon: PolygonBox
@@ -190,28 +209,42 @@ class Block(BaseModel):
                     self.structure[i] = new_id
                     break
 
-    def remove_structure_items(self, block_ids: List[BlockId]):
+    def remove_structure_items(self, block_ids: Iterable[BlockId]):
         if self.structure is not None:
+            block_ids = set(block_ids)
             self.structure = [item for item in self.structure if item not in block_ids]
 
-    def raw_text(self, document: Document) -> str:
+    def raw_text(self, document: Document, max_chars: int | None = None) -> str:
         from marker.schema.text.line import Line
         from marker.schema.text.span import Span
         from marker.schema.blocks.tablecell import TableCell
 
         if self.structure is None:
             if isinstance(self, (Span, TableCell)):
-                return self.text
+                return self.text[:max_chars]
             else:
                 return ""
 
-        text = ""
+        # Only non-empty parts are kept, so the last part tells us how the text ends
+        text_parts = []
+        total_chars = 0
         for block_id in self.structure:
+            if max_chars is not None and total_chars >= max_chars:
+                break
+
             block = document.get_block(block_id)
-            text += block.raw_text(document)
-            if isinstance(block, Line) and not text.endswith("\n"):
-                text += "\n"
-        return text
+            block_text = block.raw_text(
+                document, None if max_chars is None else max_chars - total_chars
+            )
+            if block_text:
+                text_parts.append(block_text)
+                total_chars += len(block_text)
+            if isinstance(block, Line) and not (
+                text_parts and text_parts[-1].endswith("\n")
+            ):
+                text_parts.append("\n")
+                total_chars += 1
+        return "".join(text_parts)[:max_chars]
 
     def assemble_html(
         self,
@@ -223,9 +256,9 @@ class Block(BaseModel):
         if self.ignore_for_output:
             return ""
 
-        template = ""
-        for c in child_blocks:
-            template += f"<content-ref src='{c.id}'></content-ref>"
+        template = "".join(
+            f"<content-ref src='{c.id}'></content-ref>" for c in child_blocks
+        )
 
         if self.replace_output_newlines:
             template = template.replace("\n", " ")
@@ -254,11 +287,10 @@ class Block(BaseModel):
             block = document.get_block(block_id)
             if block.removed:
                 continue
-            if (
-                block_types is None or block.block_type in block_types
-            ) and not block.removed:
+            if block_types is None or block.block_type in block_types:
                 blocks.append(block)
-            blocks += block.contained_blocks(document, block_types)
+            if block.structure is not None:
+                blocks += block.contained_blocks(document, block_types)
         return blocks
 
     def replace_block(self, block: Block, new_block: Block):
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import List
 
 from marker.schema import BlockTypes
@@ -20,18 +21,20 @@ class BaseTable(Block):
                 if c.id.block_type == BlockTypes.TableCell
             ]
 
-        unique_rows = sorted(list(set([c.row_id for c in child_cells])))
-        html_repr = "<table><tbody>"
-        for row_id in unique_rows:
-            row_cells = sorted(
-                [c for c in child_cells if c.row_id == row_id], key=lambda x: x.col_id
-            )
-            html_repr += "<tr>"
-            for cell in row_cells:
-                html_repr += cell.assemble_html(document, child_blocks, None, None)
-            html_repr += "</tr>"
-        html_repr += "</tbody></table>"
-        return html_repr
+        rows = defaultdict(list)
+        for cell in child_cells:
+            rows[cell.row_id].append(cell)
+
+        html_parts = ["<table><tbody>"]
+        for row_id in sorted(rows):
+            html_parts.append("<tr>")
+            for cell in sorted(rows[row_id], key=lambda x: x.col_id):
+                html_parts.append(
+                    cell.assemble_html(document, child_blocks, None, None)
+                )
+            html_parts.append("</tr>")
+        html_parts.append("</tbody></table>")
+        return "".join(html_parts)
 
     def assemble_html(
         self,
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Sequence, Optional
+from typing import Dict, List, Sequence, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from marker.schema import BlockTypes
 from marker.schema.blocks import Block, BlockId, BlockOutput
@@ -28,6 +28,7 @@ class Document(BaseModel):
     block_type: BlockTypes = BlockTypes.Document
     table_of_contents: List[TocItem] | None = None
     debug_data_path: str | None = None  # Path that debug data was saved to
+    _page_positions: Dict[int, int] = PrivateAttr(default_factory=dict)
 
     def get_block(self, block_id: BlockId):
         page = self.get_page(block_id.page_id)
@@ -36,11 +37,23 @@ class Document(BaseModel):
             return block
         return None
 
+    def get_page_position(self, page_id: int) -> int | None:
+        # Cached page_id -> index lookup, rebuilt whenever it no longer matches the page list
+        idx = self._page_positions.get(page_id)
+        if idx is None or idx >= len(self.pages) or self.pages[idx].page_id != page_id:
+            # Build the new index locally and swap it in at once, since other threads may be reading it
+            page_positions = {}
+            for i, page in enumerate(self.pages):
+                page_positions.setdefault(page.page_id, i)
+            self._page_positions = page_positions
+            idx = page_positions.get(page_id)
+        return idx
+
     def get_page(self, page_id):
-        for page in self.pages:
-            if page.page_id == page_id:
-                return page
-        return None
+        idx = self.get_page_position(page_id)
+        if idx is None:
+            return None
+        return self.pages[idx]
 
     def get_next_block(
         self, block: Block, ignored_block_types: List[BlockTypes] = None
@@ -56,14 +69,14 @@ class Document(BaseModel):
             return next_block
 
         # If no block found, search subsequent pages
-        for page in self.pages[self.pages.index(page) + 1 :]:
+        for page in self.pages[self.get_page_position(page.page_id) + 1 :]:
             next_block = page.get_next_block(None, ignored_block_types)
             if next_block:
                 return next_block
         return None
 
     def get_next_page(self, page: PageGroup):
-        page_idx = self.pages.index(page)
+        page_idx = self.get_page_position(page.page_id)
         if page_idx + 1 < len(self.pages):
             return self.pages[page_idx + 1]
         return None
@@ -79,7 +92,7 @@ class Document(BaseModel):
         return prev_page.get_block(prev_page.structure[-1])
 
     def get_prev_page(self, page: PageGroup):
-        page_idx = self.pages.index(page)
+        page_idx = self.get_page_position(page.page_id)
         if page_idx > 0:
             return self.pages[page_idx - 1]
         return None
@@ -87,9 +100,9 @@ class Document(BaseModel):
     def assemble_html(
         self, child_blocks: List[Block], block_config: Optional[dict] = None
     ):
-        template = ""
-        for c in child_blocks:
-            template += f"<content-ref src='{c.id}'></content-ref>"
+        template = "".join(
+            f"<content-ref src='{c.id}'></content-ref>" for c in child_blocks
+        )
         return template
 
     def render(self, block_config: Optional[dict] = None):
@@ -130,9 +130,9 @@ class PageGroup(Group):
     def assemble_html(
         self, document, child_blocks, parent_structure=None, block_config=None
     ):
-        template = ""
-        for c in child_blocks:
-            template += f"<content-ref src='{c.id}'></content-ref>"
+        template = "".join(
+            f"<content-ref src='{c.id}'></content-ref>" for c in child_blocks
+        )
         return template
 
     def compute_line_block_intersections(
@@ -69,10 +69,17 @@ class PolygonBox(BaseModel):
     @computed_field
     @property
     def bbox(self) -> List[float]:
-        min_x = min([corner[0] for corner in self.polygon])
-        min_y = min([corner[1] for corner in self.polygon])
-        max_x = max([corner[0] for corner in self.polygon])
-        max_y = max([corner[1] for corner in self.polygon])
+        # Track the running extremes in one pass over the corners, rather than building a list per coordinate
+        min_x, min_y = max_x, max_y = self.polygon[0]
+        for x, y in self.polygon[1:]:
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
         return [min_x, min_y, max_x, max_y]
 
     def expand(self, x_margin: float, y_margin: float) -> PolygonBox:
@@ -8,10 +8,13 @@ from marker.schema import BlockTypes
 from marker.schema.blocks import Block, BlockOutput
 
 HYPHENS = r"-—¬"
+TAG_PATTERN = re.compile(r"<[^>]+>")
+HYPHEN_END_PATTERN = regex.compile(rf".*[{HYPHENS}]\s?$", regex.DOTALL)
+LOWERCASE_START_PATTERN = regex.compile(r"^\s?[\p{Ll}]")
 
 
 def remove_tags(text):
-    return re.sub(r"<[^>]+>", "", text)
+    return TAG_PATTERN.sub("", text)
 
 
 def replace_last(string, old, new):
@@ -23,14 +26,9 @@ def replace_last(string, old, new):
 
 
 def strip_trailing_hyphens(line_text, next_line_text, line_html) -> str:
-    lowercase_letters = r"\p{Ll}"
+    next_line_starts_lowercase = LOWERCASE_START_PATTERN.match(next_line_text)
 
-    hyphen_regex = regex.compile(rf".*[{HYPHENS}]\s?$", regex.DOTALL)
-    next_line_starts_lowercase = regex.match(
-        rf"^\s?[{lowercase_letters}]", next_line_text
-    )
-
-    if hyphen_regex.match(line_text) and next_line_starts_lowercase:
+    if HYPHEN_END_PATTERN.match(line_text) and next_line_starts_lowercase:
         line_html = replace_last(line_html, rf"[{HYPHENS}]", "")
 
     return line_html
@@ -82,16 +80,15 @@ class Line(Block):
         return text
 
     def assemble_html(self, document, child_blocks, parent_structure, block_config):
-        template = ""
-        for c in child_blocks:
-            template += c.html
+        template = "".join(c.html for c in child_blocks)
 
         raw_text = remove_tags(template).strip()
         structure_idx = parent_structure.index(self.id)
         if structure_idx < len(parent_structure) - 1:
             next_block_id = parent_structure[structure_idx + 1]
             next_line = document.get_block(next_block_id)
-            next_line_raw_text = next_line.raw_text(document)
+            # Only the first letter matters
+            next_line_raw_text = next_line.raw_text(document, max_chars=2)
             template = strip_trailing_hyphens(raw_text, next_line_raw_text, template)
         else:
             template = template.strip(
@@ -1,13 +1,98 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from functools import lru_cache
 from typing import Optional, List, Annotated
 from io import BytesIO
 
 import PIL
 from pydantic import BaseModel
 
+from marker.logger import get_logger
 from marker.schema.blocks import Block
 from marker.util import assign_config, verify_config_keys
 import base64
 
+logger = get_logger()
+
+# LaTeX commands that start with a valid \n, \r or \t escape
+LATEX_ESCAPE_COMMANDS = [
+    "nabla",
+    "ne",
+    "neg",
+    "neq",
+    "newline",
+    "not",
+    "notin",
+    "nu",
+    "rangle",
+    "rceil",
+    "rfloor",
+    "rho",
+    "right",
+    "rightarrow",
+    "tan",
+    "tanh",
+    "tau",
+    "text",
+    "textbf",
+    "textit",
+    "textrm",
+    "tfrac",
+    "therefore",
+    "theta",
+    "tilde",
+    "times",
+    "to",
+    "top",
+    "triangle",
+]
+
+# Matches every backslash, along with what follows it when that is a real JSON escape.
+# \b and \f followed by a letter are always LaTeX (\beta, \frac), since neither shows up
+# as a control character in these responses. \n, \r and \t stay escapes unless they
+# start a known LaTeX command, so a newline before a word is kept.
+ESCAPE_PATTERN = re.compile(
+    r'\\(u[0-9a-fA-F]{4}|["\\/]|[bf](?![A-Za-z])|(?!(?:%s)(?![A-Za-z]))[nrt])?'
+    % "|".join(LATEX_ESCAPE_COMMANDS)
+)
+
+
+@lru_cache(maxsize=None)
+def get_schema_json(response_schema: type[BaseModel]) -> str:
+    # Schema generation walks the whole model, so only do it once per response schema
+    return json.dumps(response_schema.model_json_schema(), indent=2)
+
+
+class RateLimiter:
+    """
+    A thread-safe sliding window limiter that blocks callers until a request fits under the per-minute limit.
+    """
+
+    window: float = 60.0
+
+    def __init__(self, max_requests: int):
+        self.max_requests = max_requests
+        self.request_times = deque()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            while self.request_times and now - self.request_times[0] >= self.window:
+                self.request_times.popleft()
+
+            if len(self.request_times) >= self.max_requests:
+                # Wait for the oldest request to leave the window
+                time.sleep(self.window - (now - self.request_times.popleft()))
+                now = time.monotonic()
+
+            self.request_times.append(now)
+
 
 class BaseService:
     timeout: Annotated[int, "The timeout to use for the service."] = 30
@@ -15,6 +100,16 @@ class BaseService:
         int, "The maximum number of retries to use for the service."
     ] = 2
     retry_wait_time: Annotated[int, "The wait time between retries."] = 3
+    max_requests_per_minute: Annotated[
+        int,
+        "The maximum number of requests per minute to send to the service, shared across all threads.",
+        "Default is None, which will not limit requests.",
+    ] = None
+    llm_cache_dir: Annotated[
+        str,
+        "A directory to cache LLM responses in, keyed on the model, prompt, images and response schema.",
+        "Default is None, which will not cache responses.",
+    ] = None
 
     def img_to_base64(self, img: PIL.Image.Image):
         image_bytes = BytesIO()
@@ -40,6 +135,90 @@ class BaseService:
         # Ensure we have all necessary fields filled out (API keys, etc.)
         verify_config_keys(self)
 
+        self.rate_limiter = None
+        if self.max_requests_per_minute:
+            self.rate_limiter = RateLimiter(self.max_requests_per_minute)
+
+    def wait_for_rate_limit(self):
+        # Throttle before sending, instead of relying on the provider's 429s and our retry backoff
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def load_json_response(self, response_text: str) -> dict:
+        # Repair common formatting problems locally, instead of paying for another request
+        response_text = response_text.strip()
+        if response_text.startswith("```json"):
+            response_text = response_text[7:]
+        if response_text.endswith("```"):
+            response_text = response_text[:-3]
+
+        try:
+            return json.loads(response_text)
+        except json.JSONDecodeError:
+            # Double any backslash that doesn't start a valid escape, usually from LaTeX like \alpha
+            escaped_text = ESCAPE_PATTERN.sub(
+                lambda m: m.group(0) if m.group(1) else "\\\\", response_text
+            )
+            return json.loads(escaped_text)
+
+    def get_cache_key(
+        self,
+        model_name: str,
+        prompt: str,
+        image: PIL.Image.Image | List[PIL.Image.Image] | None,
+        response_schema: type[BaseModel],
+    ) -> str | None:
+        if not self.llm_cache_dir:
+            return None
+
+        if not image:
+            image = []
+        elif not isinstance(image, list):
+            image = [image]
+
+        hasher = hashlib.sha256()
+        hasher.update(f"{self.__class__.__name__}/{model_name}".encode("utf-8"))
+        hasher.update(get_schema_json(response_schema).encode("utf-8"))
+        hasher.update(prompt.encode("utf-8"))
+        for img in image:
+            hasher.update(f"{img.mode}/{img.size}".encode("utf-8"))
+            hasher.update(img.tobytes())
+        return hasher.hexdigest()
+
+    def get_cached_response(self, cache_key: str | None) -> dict | None:
+        if cache_key is None:
+            return None
+
+        cache_path = os.path.join(self.llm_cache_dir, f"{cache_key}.json")
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def cache_response(self, cache_key: str | None, response: dict | None):
+        # Only successful responses are cached, so failures are retried on the next run
+        if cache_key is None or not response:
+            return
+
+        cache_path = os.path.join(self.llm_cache_dir, f"{cache_key}.json")
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.llm_cache_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(response, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            # A failed cache write shouldn't cost us a response we already paid for
+            logger.warning(f"Could not write LLM response to cache: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def __call__(
         self,
         prompt: str,
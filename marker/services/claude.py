@@ -1,5 +1,5 @@
-import json
 import time
+from functools import lru_cache
 from typing import List, Annotated, T
 
 import PIL
@@ -10,11 +10,22 @@ from marker.logger import get_logger
 from pydantic import BaseModel
 
 from marker.schema.blocks import Block
-from marker.services import BaseService
+from marker.services import BaseService, get_schema_json
 
 logger = get_logger()
 
 
+@lru_cache(maxsize=None)
+def get_system_prompt(response_schema: type[BaseModel]) -> str:
+    return f"""
+Follow the instructions given by the user prompt.  You must provide your response in JSON format matching this schema:
+
+{get_schema_json(response_schema)}
+
+Respond only with the JSON schema, nothing else.  Do not include ```json, ```,  or any other formatting.
+""".strip()
+
+
 class ClaudeService(BaseService):
     claude_model_name: Annotated[
         str, "The name of the Google model to use for the service."
@@ -78,14 +89,14 @@ class ClaudeService(BaseService):
         if timeout is None:
             timeout = self.timeout
 
-        schema_example = response_schema.model_json_schema()
-        system_prompt = f"""
-Follow the instructions given by the user prompt.  You must provide your response in JSON format matching this schema:
-
-{json.dumps(schema_example, indent=2)}
+        cache_key = self.get_cache_key(
+            self.claude_model_name, prompt, image, response_schema
+        )
+        cached_response = self.get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
 
-Respond only with the JSON schema, nothing else.  Do not include ```json, ```,  or any other formatting.
-""".strip()
+        system_prompt = get_system_prompt(response_schema)
 
         client = self.get_client()
         image_data = self.format_image_for_llm(image)
@@ -103,6 +114,7 @@ Respond only with the JSON schema, nothing else.  Do not include ```json, ```,
         total_tries = max_retries + 1
         for tries in range(1, total_tries + 1):
             try:
+                self.wait_for_rate_limit()
                 response = client.messages.create(
                     system=system_prompt,
                     model=self.claude_model_name,
@@ -112,7 +124,9 @@ Respond only with the JSON schema, nothing else.  Do not include ```json, ```,
                 )
                 # Extract and validate response
                 response_text = response.content[0].text
-                return self.validate_response(response_text, response_schema)
+                response = self.validate_response(response_text, response_schema)
+                self.cache_response(cache_key, response)
+                return response
             except (RateLimitError, APITimeoutError) as e:
                 # Rate limit exceeded
                 if tries == total_tries:
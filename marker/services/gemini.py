@@ -1,6 +1,4 @@
-import json
 import time
-import traceback
 from io import BytesIO
 from typing import List, Annotated
 
@@ -52,12 +50,20 @@ class BaseGeminiService(BaseService):
         if timeout is None:
             timeout = self.timeout
 
+        cache_key = self.get_cache_key(
+            self.gemini_model_name, prompt, image, response_schema
+        )
+        cached_response = self.get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
         client = self.get_google_client(timeout=timeout)
         image_parts = self.format_image_for_llm(image)
 
         total_tries = max_retries + 1
         for tries in range(1, total_tries + 1):
             try:
+                self.wait_for_rate_limit()
                 responses = client.models.generate_content(
                     model=self.gemini_model_name,
                     contents=image_parts
@@ -76,7 +82,9 @@ class BaseGeminiService(BaseService):
                     block.update_metadata(
                         llm_tokens_used=total_tokens, llm_request_count=1
                     )
-                return json.loads(output)
+                response = self.load_json_response(output)
+                self.cache_response(cache_key, response)
+                return response
             except APIError as e:
                 if e.code in [429, 443, 503]:
                     # Rate limit exceeded
@@ -97,7 +105,7 @@ class BaseGeminiService(BaseService):
                     break
             except Exception as e:
                 logger.error(f"Exception: {e}")
-                traceback.print_exc()
+                logger.debug("Traceback for Gemini exception", exc_info=True)
                 break
 
         return {}
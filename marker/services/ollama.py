@@ -1,4 +1,3 @@
-import json
 from typing import Annotated, List
 
 import PIL
@@ -36,6 +35,11 @@ class OllamaService(BaseService):
         max_retries: int | None = None,
         timeout: int | None = None,
     ):
+        cache_key = self.get_cache_key(self.ollama_model, prompt, image, response_schema)
+        cached_response = self.get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
         url = f"{self.ollama_base_url}/api/generate"
         headers = {"Content-Type": "application/json"}
 
@@ -57,6 +61,7 @@ class OllamaService(BaseService):
         }
 
         try:
+            self.wait_for_rate_limit()
             response = requests.post(url, json=payload, headers=headers, verify=self.ollama_ssl_verify)
             response.raise_for_status()
             response_data = response.json()
@@ -69,7 +74,9 @@ class OllamaService(BaseService):
                 block.update_metadata(llm_request_count=1, llm_tokens_used=total_tokens)
 
             data = response_data["response"]
-            return json.loads(data)
+            response = self.load_json_response(data)
+            self.cache_response(cache_key, response)
+            return response
         except Exception as e:
             logger.warning(f"Ollama inference failed: {e}")
 
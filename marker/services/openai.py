@@ -1,4 +1,3 @@
-import json
 import time
 from typing import Annotated, List
 
@@ -72,6 +71,13 @@ class OpenAIService(BaseService):
         if timeout is None:
             timeout = self.timeout
 
+        cache_key = self.get_cache_key(
+            self.openai_model, prompt, image, response_schema
+        )
+        cached_response = self.get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
         client = self.get_client()
         image_data = self.format_image_for_llm(image)
 
@@ -88,6 +94,7 @@ class OpenAIService(BaseService):
         total_tries = max_retries + 1
         for tries in range(1, total_tries + 1):
             try:
+                self.wait_for_rate_limit()
                 response = client.beta.chat.completions.parse(
                     extra_headers={
                         "X-Title": "Marker",
@@ -104,7 +111,9 @@ class OpenAIService(BaseService):
                     block.update_metadata(
                         llm_tokens_used=total_tokens, llm_request_count=1
                     )
-                return json.loads(response_text)
+                response = self.load_json_response(response_text)
+                self.cache_response(cache_key, response)
+                return response
             except (APITimeoutError, RateLimitError) as e:
                 # Rate limit exceeded
                 if tries == total_tries:
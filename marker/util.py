@@ -11,6 +11,17 @@ from pydantic import BaseModel
 from marker.schema.polygon import PolygonBox
 from marker.settings import settings
 
+# Unicode spaces that get normalized to a regular space
+SPACE_TRANSLATION = str.maketrans(
+    {
+        "\u2003": " ",  # em space
+        "\u2002": " ",  # en space
+        "\u00a0": " ",  # non-breaking space
+        "\u200b": " ",  # zero-width space
+        "\u3000": " ",  # ideographic space
+    }
+)
+
 OPENING_TAG_REGEX = re.compile(r"<((?:math|i|b))(?:\s+[^>]*)?>")
 CLOSING_TAG_REGEX = re.compile(r"</((?:math|i|b))>")
 TAG_MAPPING = {
@@ -1,5 +1,5 @@
 import tempfile
-from typing import Dict, Type
+from typing import Dict, List, Type
 
 from PIL import Image, ImageDraw
 
@@ -18,6 +18,9 @@ from marker.renderers.chunk import ChunkRenderer
 from marker.renderers.html import HTMLRenderer
 from marker.schema import BlockTypes
 from marker.schema.blocks import Block
+from marker.schema.document import Document
+from marker.schema.groups import PageGroup
+from marker.schema.polygon import PolygonBox
 from marker.renderers.markdown import MarkdownRenderer
 from marker.renderers.json import JSONRenderer
 from marker.schema.registry import register_block_class
@@ -87,6 +90,29 @@ def temp_doc(request, pdf_dataset):
     yield temp_pdf
 
 
+@pytest.fixture(scope="function")
+def build_document():
+    # Builds a model-free document with a column of block_cls blocks on each page
+    def build(block_cls: Type[Block], blocks_per_page: List[int]) -> Document:
+        pages = []
+        for page_id, block_count in enumerate(blocks_per_page):
+            page = PageGroup(
+                polygon=PolygonBox.from_bbox([0, 0, 1000, 1000]), page_id=page_id
+            )
+            for i in range(block_count):
+                block = page.add_full_block(
+                    block_cls(
+                        polygon=PolygonBox.from_bbox([0, i * 100, 500, i * 100 + 50]),
+                        page_id=page_id,
+                    )
+                )
+                page.add_structure(block)
+            pages.append(page)
+        return Document(filepath="test.pdf", pages=pages)
+
+    return build
+
+
 @pytest.fixture(scope="function")
 def doc_provider(request, config, temp_doc):
     provider_cls = provider_from_filepath(temp_doc.name)
@@ -0,0 +1,63 @@
+import numpy as np
+
+from marker.processors.list import ListProcessor, compute_indent_levels
+from marker.schema.blocks import ListItem
+from marker.schema.document import Document
+from marker.schema.groups import ListGroup, PageGroup
+from marker.schema.polygon import PolygonBox
+from marker.schema.text.line import Line
+
+
+def test_compute_indent_levels():
+    # Three items, the second one indented under the first, and a line that isn't a list item
+    x_starts = np.array([10, 40, 10, 10], dtype=np.float64)
+    x_ends = np.array([200, 200, 200, 200], dtype=np.float64)
+    y_starts = np.array([0, 20, 40, 60], dtype=np.float64)
+    is_list_item = np.array([True, True, True, False])
+    indent_levels = np.zeros(4, dtype=np.int32)
+
+    levels = compute_indent_levels(
+        x_starts, x_ends, y_starts, is_list_item, indent_levels, 5.0
+    )
+    assert levels.tolist() == [0, 1, 0, 0]
+
+
+def test_compute_indent_levels_column_break():
+    # The third item starts a new column, so it can't be nested under the second
+    x_starts = np.array([10, 40, 300], dtype=np.float64)
+    x_ends = np.array([200, 200, 500], dtype=np.float64)
+    y_starts = np.array([0, 20, 0], dtype=np.float64)
+    is_list_item = np.array([True, True, True])
+    indent_levels = np.zeros(3, dtype=np.int32)
+
+    levels = compute_indent_levels(
+        x_starts, x_ends, y_starts, is_list_item, indent_levels, 5.0
+    )
+    assert levels.tolist() == [0, 1, 0]
+
+
+def test_list_group_indentation_skips_lines():
+    page = PageGroup(polygon=PolygonBox.from_bbox([0, 0, 1000, 1000]), page_id=0)
+    item = page.add_full_block(
+        ListItem(polygon=PolygonBox.from_bbox([10, 0, 500, 20]), page_id=0)
+    )
+    line = page.add_full_block(
+        Line(polygon=PolygonBox.from_bbox([10, 20, 500, 40]), page_id=0)
+    )
+    nested_item = page.add_full_block(
+        ListItem(polygon=PolygonBox.from_bbox([60, 40, 500, 60]), page_id=0)
+    )
+    list_group = page.add_full_block(
+        ListGroup(polygon=PolygonBox.from_bbox([10, 0, 500, 60]), page_id=0)
+    )
+    list_group.structure = [item.id, line.id, nested_item.id]
+    page.add_structure(list_group)
+    document = Document(filepath="test.pdf", pages=[page])
+
+    ListProcessor(None).list_group_indentation(document, [(page, [list_group])])
+
+    # The line stays in the group, and never becomes the parent of a list item
+    assert nested_item.list_indent_level == 1
+    assert item.structure == [nested_item.id]
+    assert line.structure is None
+    assert list_group.structure == [item.id, line.id]
@@ -0,0 +1,66 @@
+from unittest.mock import Mock
+
+from marker.processors.llm.llm_page_correction import LLMPageCorrectionProcessor
+from marker.schema.blocks import Text
+
+
+def run_reorder(document, block_ids):
+    mock_cls = Mock()
+    mock_cls.return_value = {
+        "analysis": "",
+        "correction_type": "reorder",
+        "blocks": [
+            {"id": block_id, "block_type": "", "html": ""} for block_id in block_ids
+        ],
+    }
+    processor = LLMPageCorrectionProcessor(
+        mock_cls, {"use_llm": True, "block_correction_prompt": "Fix the reading order."}
+    )
+    processor(document)
+
+
+def test_llm_page_correction_reorder(build_document):
+    document = build_document(Text, [3, 1])
+    page_structure = [str(block_id) for block_id in document.pages[0].structure]
+
+    run_reorder(document, page_structure[::-1])
+
+    assert [
+        str(block_id) for block_id in document.pages[0].structure
+    ] == page_structure[::-1]
+    # The response only matches page 0, so page 1 is left alone
+    assert [str(block_id) for block_id in document.pages[1].structure] == [
+        "/page/1/Text/0"
+    ]
+
+
+def test_llm_page_correction_reorder_missing_block(build_document):
+    document = build_document(Text, [3, 1])
+    page_structure = list(document.pages[0].structure)
+
+    run_reorder(document, [str(block_id) for block_id in page_structure[:2]])
+
+    assert document.pages[0].structure == page_structure
+
+
+def test_llm_page_correction_reorder_duplicate_block(build_document):
+    document = build_document(Text, [3, 1])
+    page_structure = list(document.pages[0].structure)
+
+    run_reorder(
+        document, [str(block_id) for block_id in page_structure + page_structure[:1]]
+    )
+
+    assert document.pages[0].structure == page_structure
+
+
+def test_llm_page_correction_reorder_other_page(build_document):
+    document = build_document(Text, [3, 1])
+    page_structure = list(document.pages[0].structure)
+
+    run_reorder(
+        document,
+        [str(block_id) for block_id in page_structure[::-1]] + ["/page/1/Text/0"],
+    )
+
+    assert document.pages[0].structure == page_structure
@@ -1,17 +1,23 @@
 from unittest.mock import MagicMock, Mock
 
 import pytest
+from PIL import Image
 from marker.processors.llm.llm_complex import LLMComplexRegionProcessor
 from marker.processors.llm.llm_equation import LLMEquationProcessor
 
 from marker.processors.llm.llm_form import LLMFormProcessor
 from marker.processors.llm.llm_image_description import LLMImageDescriptionProcessor
+from marker.processors.llm.llm_mathblock import LLMMathBlockProcessor
 from marker.processors.llm.llm_meta import LLMSimpleBlockMetaProcessor
 from marker.processors.llm.llm_table import LLMTableProcessor
 from marker.processors.table import TableProcessor
 from marker.renderers.markdown import MarkdownRenderer
 from marker.schema import BlockTypes
-from marker.schema.blocks import ComplexRegion
+from marker.schema.blocks import ComplexRegion, InlineMath, Text
+from marker.schema.document import Document
+from marker.schema.groups import PageGroup
+from marker.schema.polygon import PolygonBox
+from marker.schema.text import Line
 
 
 @pytest.mark.filename("form_1040.pdf")
@@ -179,4 +185,35 @@ def test_multi_llm_processors(pdf_document):
 
     contained_equations = pdf_document.contained_blocks((BlockTypes.Equation,))
     print([equation.html for equation in contained_equations])
-    assert all(equation.html == description for equation in contained_equations)
\ No newline at end of file
+    assert all(equation.html == description for equation in contained_equations)
+
+
+def test_llm_mathblock_processor_rewrites_once():
+    page = PageGroup(
+        polygon=PolygonBox.from_bbox([0, 0, 1000, 1000]),
+        page_id=0,
+        highres_image=Image.new("RGB", (1000, 1000), color="white"),
+    )
+    for i, block_cls in enumerate([InlineMath, Text]):
+        block = page.add_full_block(
+            block_cls(polygon=PolygonBox.from_bbox([0, i * 100, 500, i * 100 + 50]), page_id=0)
+        )
+        page.add_structure(block)
+        line = page.add_full_block(
+            Line(polygon=block.polygon, page_id=0, formats=["math"])
+        )
+        block.add_structure(line)
+    document = Document(filepath="test.pdf", pages=[page])
+
+    corrected_html = "<p>This is corrected <math>x^2</math> text.</p>"
+    mock_cls = Mock()
+    mock_cls.return_value = {"analysis": "", "corrected_html": corrected_html}
+
+    config = {"use_llm": True, "gemini_api_key": "test", "redo_inline_math": True}
+    processor = LLMMathBlockProcessor(mock_cls, config)
+    processor(document)
+
+    # The text block is both a detected math block and an additional block on a math-heavy page
+    rewritten_blocks = [call.args[2].block_type for call in mock_cls.call_args_list]
+    assert sorted(rewritten_blocks) == sorted([BlockTypes.TextInlineMath, BlockTypes.Text])
+    assert all(block.html == corrected_html for block in document.contained_blocks((BlockTypes.Text,)))
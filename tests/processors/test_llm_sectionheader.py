@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from marker.processors.llm.llm_sectionheader import LLMSectionHeaderProcessor
+from marker.schema.blocks import SectionHeader
+
+
+def test_llm_sectionheader_batches(build_document):
+    document = build_document(SectionHeader, [3, 2])
+    headers = document.contained_blocks()
+    prompts = []
+
+    def mock_llm(prompt, image, block, response_schema):
+        assert "contiguous slice" in prompt
+        header_json = json.loads(prompt.rsplit("```json\n", 1)[1].rsplit("\n```", 1)[0])
+        prompts.append(header_json)
+        batch_idx = len(prompts) - 1
+        # Rewrite every header, including the one carried over from the previous batch
+        return {
+            "analysis": "",
+            "correction_type": "rewrite",
+            "blocks": [
+                {"id": item["id"], "html": f"<h2>batch {batch_idx}</h2>"}
+                for item in header_json
+            ],
+        }
+
+    processor = LLMSectionHeaderProcessor(
+        mock_llm, {"use_llm": True, "max_headers_per_request": 2}
+    )
+    processor(document)
+
+    # Each batch after the first repeats the previous batch's last header
+    assert [[item["id"] for item in batch] for batch in prompts] == [
+        [str(headers[0].id), str(headers[1].id)],
+        [str(headers[1].id), str(headers[2].id), str(headers[3].id)],
+        [str(headers[3].id), str(headers[4].id)],
+    ]
+
+    # Only the carried-over header is marked as context
+    assert [[item.get("context", False) for item in batch] for batch in prompts] == [
+        [False, False],
+        [True, False, False],
+        [True, False],
+    ]
+
+    # The carried-over header is sent as corrected by the previous batch
+    assert prompts[1][0]["html"] == "<h2>batch 0</h2>"
+    assert prompts[2][0]["html"] == "<h2>batch 1</h2>"
+
+    # ... and isn't rewritten again by the batch it was carried into
+    assert [header.html for header in headers] == [
+        "<h2>batch 0</h2>",
+        "<h2>batch 0</h2>",
+        "<h2>batch 1</h2>",
+        "<h2>batch 1</h2>",
+        "<h2>batch 2</h2>",
+    ]
+
+
+def test_llm_sectionheader_single_request(build_document):
+    document = build_document(SectionHeader, [3, 2])
+    prompts = []
+
+    def mock_llm(prompt, image, block, response_schema):
+        prompts.append(prompt)
+        return {"analysis": "", "correction_type": "no_corrections", "blocks": []}
+
+    processor = LLMSectionHeaderProcessor(mock_llm, {"use_llm": True})
+    processor(document)
+
+    # All of the headers fit in one request, so it isn't described as a slice
+    assert len(prompts) == 1
+    assert "contiguous slice" not in prompts[0]
+    assert '"context"' not in prompts[0]
+
+
+def test_llm_sectionheader_invalid_batch_size():
+    with pytest.raises(ValueError):
+        LLMSectionHeaderProcessor(
+            None, {"use_llm": True, "max_headers_per_request": -1}
+        )
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -5,6 +6,10 @@ import pytest
 from marker.processors.llm.llm_table_merge import LLMTableMergeProcessor
 from marker.processors.table import TableProcessor
 from marker.schema import BlockTypes
+from marker.schema.blocks import Table, TableCell
+from marker.schema.document import Document
+from marker.schema.groups import PageGroup
+from marker.schema.polygon import PolygonBox
 
 
 @pytest.mark.filename("table_ex2.pdf")
@@ -25,4 +30,91 @@ def test_llm_table_processor_nomerge(pdf_document, detection_model, table_rec_mo
     processor(pdf_document)
 
     tables = pdf_document.contained_blocks((BlockTypes.Table,))
-    assert len(tables) == 3
\ No newline at end of file
+    assert len(tables) == 3
+
+
+def test_table_merge_column_count():
+    cells = [
+        SimpleNamespace(row_id=0, col_id=0, colspan=2, rowspan=1),
+        SimpleNamespace(row_id=1, col_id=0, colspan=1, rowspan=1),
+        SimpleNamespace(row_id=1, col_id=1, colspan=1, rowspan=1),
+        SimpleNamespace(row_id=1, col_id=2, colspan=1, rowspan=1),
+    ]
+    assert LLMTableMergeProcessor.get_column_count(cells) == 3
+    assert LLMTableMergeProcessor.get_column_count([]) == 0
+
+
+def test_table_merge_row_count():
+    cells = [
+        SimpleNamespace(row_id=0, col_id=0, colspan=1, rowspan=2),
+        SimpleNamespace(row_id=0, col_id=1, colspan=1, rowspan=1),
+        SimpleNamespace(row_id=1, col_id=1, colspan=1, rowspan=1),
+        SimpleNamespace(row_id=2, col_id=1, colspan=1, rowspan=1),
+    ]
+    assert LLMTableMergeProcessor.get_row_count(cells) == 3
+    assert LLMTableMergeProcessor.get_row_count([]) == 0
+
+
+def build_table_document(tables):
+    # One table per page, given as (bbox, row count, column count)
+    pages = []
+    for page_id, (bbox, rows, cols) in enumerate(tables):
+        page = PageGroup(
+            polygon=PolygonBox.from_bbox([0, 0, 1000, 1000]), page_id=page_id
+        )
+        table = page.add_full_block(
+            Table(polygon=PolygonBox.from_bbox(bbox), page_id=page_id)
+        )
+        page.add_structure(table)
+        for row_id in range(rows):
+            for col_id in range(cols):
+                cell = page.add_full_block(
+                    TableCell(
+                        polygon=PolygonBox.from_bbox(bbox),
+                        page_id=page_id,
+                        rowspan=1,
+                        colspan=1,
+                        row_id=row_id,
+                        col_id=col_id,
+                        is_header=False,
+                    )
+                )
+                table.add_structure(cell)
+        pages.append(page)
+    return Document(filepath="test.pdf", pages=pages)
+
+
+def get_table_runs(document):
+    processor = LLMTableMergeProcessor(Mock(), {"use_llm": True, "disable_tqdm": True})
+    table_runs = []
+
+    def record_run(document, blocks, table_cells):
+        table_runs.append([str(block.id) for block in blocks])
+
+    # Only check which tables are paired up, without rendering them for the LLM
+    processor.process_rewriting = record_run
+    processor(document)
+    return table_runs
+
+
+def test_table_merge_runs_across_pages():
+    document = build_table_document(
+        [([0, 100, 1000, 900], 10, 3), ([0, 50, 1000, 850], 10, 3)]
+    )
+    assert get_table_runs(document) == [["/page/0/Table/0", "/page/1/Table/0"]]
+
+
+def test_table_merge_runs_start_threshold():
+    # The second table starts too far down its page to be a continuation
+    document = build_table_document(
+        [([0, 100, 1000, 900], 10, 3), ([0, 300, 1000, 1000], 10, 3)]
+    )
+    assert get_table_runs(document) == []
+
+
+def test_table_merge_runs_row_mismatch():
+    # Neither the row nor the column counts are close enough
+    document = build_table_document(
+        [([0, 100, 1000, 900], 10, 3), ([0, 50, 1000, 850], 15, 5)]
+    )
+    assert get_table_runs(document) == []
@@ -0,0 +1,8 @@
+from marker.schema import BlockTypes
+from marker.schema.blocks import BlockId
+
+
+def test_block_id_from_str():
+    block_id = BlockId(page_id=3, block_id=12, block_type=BlockTypes.SectionHeader)
+    assert BlockId.from_str(str(block_id)) == block_id
+    assert BlockId.from_str(" page/3/SectionHeader/12 ") == block_id
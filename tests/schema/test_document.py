@@ -0,0 +1,41 @@
+from marker.schema.blocks import Text
+
+
+def test_document_page_lookup(build_document):
+    document = build_document(Text, [1, 1, 1, 1])
+    pages = list(document.pages)
+
+    assert document.get_page(2) is pages[2]
+    assert document.get_next_page(pages[2]) is pages[3]
+    assert document.get_prev_page(pages[2]) is pages[1]
+    assert document.get_next_page(pages[3]) is None
+    assert document.get_prev_page(pages[0]) is None
+
+
+def test_document_page_lookup_after_reorder(build_document):
+    document = build_document(Text, [1, 1, 1, 1])
+    pages = list(document.pages)
+    # Fill the cached positions before the page list changes
+    assert all(document.get_page(page.page_id) is page for page in pages)
+
+    document.pages = pages[::-1]
+
+    assert document.get_page(0) is pages[0]
+    assert document.get_page(3) is pages[3]
+    assert document.get_next_page(pages[3]) is pages[2]
+    assert document.get_prev_page(pages[2]) is pages[3]
+    assert document.get_next_page(pages[0]) is None
+    assert document.get_prev_page(pages[3]) is None
+
+
+def test_document_page_lookup_after_truncate(build_document):
+    document = build_document(Text, [1, 1, 1, 1])
+    pages = list(document.pages)
+    assert all(document.get_page(page.page_id) is page for page in pages)
+
+    document.pages = pages[:2]
+
+    assert document.get_page(1) is pages[1]
+    assert document.get_page(3) is None
+    assert document.get_next_page(pages[1]) is None
+    assert document.get_prev_page(pages[1]) is pages[0]
@@ -0,0 +1,45 @@
+from marker.services import BaseService
+
+
+class JsonService(BaseService):
+    pass
+
+
+def test_load_json_response():
+    service = JsonService()
+    assert service.load_json_response('```json\n{"answer": "yes"}\n```') == {
+        "answer": "yes"
+    }
+
+
+def test_load_json_response_repairs_latex():
+    service = JsonService()
+
+    response = service.load_json_response(r'{"h": "\alpha \frac{1}{2} \beta \times"}')
+    assert response == {"h": r"\alpha \frac{1}{2} \beta \times"}
+
+    response = service.load_json_response(
+        r'{"h": "\underline{x} \upsilon \frac{1}{2}"}'
+    )
+    assert response == {"h": r"\underline{x} \upsilon \frac{1}{2}"}
+
+    response = service.load_json_response(
+        r'{"h": "\left( \text{a} \right) \to \nabla"}'
+    )
+    assert response == {"h": r"\left( \text{a} \right) \to \nabla"}
+
+
+def test_load_json_response_repairs_latex_keeps_newlines():
+    service = JsonService()
+    response = service.load_json_response(
+        r'{"html": "<p>First line\nSecond line with $\alpha$</p>"}'
+    )
+    assert response == {"html": "<p>First line\nSecond line with $\\alpha$</p>"}
+
+
+def test_load_json_response_keeps_valid_escapes():
+    service = JsonService()
+    response = service.load_json_response(
+        r'{"h": "\alpha \\beta \"q\" \u00e9 a\n b\t1"}'
+    )
+    assert response == {"h": '\\alpha \\beta "q" \u00e9 a\n b\t1'}
@@ -0,0 +1,54 @@
+from PIL import Image
+from pydantic import BaseModel
+
+from marker.services import BaseService
+
+
+class CacheSchema(BaseModel):
+    answer: str
+
+
+class CacheService(BaseService):
+    pass
+
+
+def test_llm_cache_roundtrip(tmp_path):
+    service = CacheService({"llm_cache_dir": str(tmp_path)})
+    image = Image.new("RGB", (10, 10), color="white")
+
+    cache_key = service.get_cache_key("model", "prompt", image, CacheSchema)
+    assert service.get_cached_response(cache_key) is None
+
+    service.cache_response(cache_key, {"answer": "yes"})
+    assert service.get_cached_response(cache_key) == {"answer": "yes"}
+
+    # Any change to the request contents gives a different key
+    other_image = Image.new("RGB", (10, 10), color="black")
+    assert (
+        service.get_cache_key("model", "prompt", other_image, CacheSchema) != cache_key
+    )
+    assert (
+        service.get_cache_key("model", "other prompt", image, CacheSchema) != cache_key
+    )
+    assert (
+        service.get_cache_key("other model", "prompt", image, CacheSchema) != cache_key
+    )
+
+
+def test_llm_cache_disabled():
+    service = CacheService()
+    assert service.get_cache_key("model", "prompt", None, CacheSchema) is None
+    assert service.get_cached_response(None) is None
+
+
+def test_llm_cache_write_failure(tmp_path):
+    # A file where the cache directory should be makes every write fail
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("")
+    service = CacheService({"llm_cache_dir": str(cache_dir)})
+
+    cache_key = service.get_cache_key("model", "prompt", None, CacheSchema)
+    service.cache_response(cache_key, {"answer": "yes"})
+
+    assert service.get_cached_response(cache_key) is None
+    assert list(tmp_path.iterdir()) == [cache_dir]
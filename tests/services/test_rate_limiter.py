@@ -0,0 +1,17 @@
+import time
+
+from marker.services import RateLimiter
+
+
+def test_rate_limiter_blocks_over_limit():
+    limiter = RateLimiter(2)
+    limiter.window = 0.2
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # The third request has to wait for the first to leave the window
+    assert elapsed >= 0.2
+    assert len(limiter.request_times) == 2